@@ -25,6 +25,10 @@ class M3UCacheManager:
         self._ensure_cache_dir_exists()
         self._cache_lock = threading.RLock()
 
+        # Source file hashes memoized per path as (size, mtime_ns, hash), so an
+        # unchanged playlist is only read and hashed once per session
+        self._file_hash_memo: Dict[str, Tuple[int, int, str]] = {}
+
         # Cache settings for optimal performance
         self.cache_version = "1.0"
         self.max_cache_age_days = 30  # Auto-cleanup old cache files
@@ -91,15 +95,29 @@ class M3UCacheManager:
         """
         try:
             stat = os.stat(file_path)
-            return {
-                "size": stat.st_size,
-                "mtime": stat.st_mtime,
-                "hash": self._calculate_file_hash(file_path),
-                "path": file_path,
-            }
         except (OSError, IOError):
             return {}
 
+        # Reuse the hash while size and mtime are unchanged
+        memo = self._file_hash_memo.get(file_path)
+        if memo is not None and memo[:2] == (stat.st_size, stat.st_mtime_ns):
+            file_hash = memo[2]
+        else:
+            file_hash = self._calculate_file_hash(file_path)
+            if file_hash:
+                self._file_hash_memo[file_path] = (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    file_hash,
+                )
+
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": file_hash,
+            "path": file_path,
+        }
+
     def _is_cache_valid(self, source_path: str) -> bool:
         """
         Check if cached data is still valid for the given source.
@@ -110,28 +128,22 @@ class M3UCacheManager:
         Returns:
             True if cache is valid, False otherwise
         """
-        cache_file = self._get_cache_file_path(source_path)
         metadata_file = self._get_cache_metadata_path(source_path)
 
-        # Check if cache files exist
-        if not os.path.exists(cache_file) or not os.path.exists(metadata_file):
-            return False
-
-        # Check if source file exists
-        if not os.path.exists(source_path):
-            return False
-
         try:
-            # Load cached metadata
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                cached_metadata = json.load(f)
+            # Load cached metadata; a missing file raises instead of being
+            # probed with a separate exists() call
+            with open(metadata_file, "rb") as f:
+                cached_metadata = json.loads(f.read())
 
             # Verify cache version
             if cached_metadata.get("cache_version") != self.cache_version:
                 return False
 
-            # Get current source file metadata
+            # Get current source file metadata (empty if the source is gone)
             current_metadata = self._get_file_metadata(source_path)
+            if not current_metadata:
+                return False
             source_metadata = cached_metadata.get("source_metadata", {})
 
             # Quick checks first (size and mtime)
@@ -229,7 +241,7 @@ class M3UCacheManager:
                     cache_data = pickle.load(f)
 
                 # Verify cache structure
-                if not all(key in cache_data for key in ["channels", "categories"]):
+                if not all(key in cache_data for key in ("channels", "categories")):
                     return None
 
                 channels = cache_data["channels"]
@@ -241,6 +253,11 @@ class M3UCacheManager:
 
                 return channels, categories
 
+            except FileNotFoundError:
+                # Data file removed behind our back (e.g. temp cleanup); drop
+                # the orphaned metadata so the source gets parsed again
+                self._remove_cache(source_path)
+                return None
             except Exception as e:
                 print(f"Error loading cache for {source_path}: {e}")
                 # Invalid cache, remove it
@@ -293,11 +310,15 @@ class M3UCacheManager:
             return None
 
         try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+            with open(metadata_file, "rb") as f:
+                metadata = json.loads(f.read())
 
-            # Add cache validity status
-            metadata["is_valid"] = self._is_cache_valid(source_path)
+            # Add cache validity status. _is_cache_valid() only reads the
+            # metadata, so also confirm the data file it describes is still
+            # there; otherwise callers would announce a cache load that fails.
+            metadata["is_valid"] = self._is_cache_valid(source_path) and os.path.exists(
+                self._get_cache_file_path(source_path)
+            )
 
             return metadata
 
@@ -319,20 +340,22 @@ class M3UCacheManager:
         removed_count = 0
 
         try:
-            for filename in os.listdir(self.cache_dir):
-                if not filename.endswith(".cache"):
-                    continue
+            with os.scandir(self.cache_dir) as entries:
+                cache_entries = [e for e in entries if e.name.endswith(".cache")]
 
-                cache_file = os.path.join(self.cache_dir, filename)
+            for entry in cache_entries:
+                cache_file = entry.path
                 metadata_file = cache_file + ".meta"
 
                 try:
-                    cache_stat = os.stat(cache_file)
+                    cache_stat = entry.stat()
                     if cache_stat.st_mtime < cutoff_time:
                         # Remove old cache
                         os.remove(cache_file)
-                        if os.path.exists(metadata_file):
+                        try:
                             os.remove(metadata_file)
+                        except FileNotFoundError:
+                            pass
                         removed_count += 1
                 except Exception:
                     continue
@@ -356,15 +379,15 @@ class M3UCacheManager:
         }
 
         try:
-            for filename in os.listdir(self.cache_dir):
-                if not filename.endswith(".cache"):
-                    continue
+            with os.scandir(self.cache_dir) as entries:
+                cache_entries = [e for e in entries if e.name.endswith(".cache")]
 
-                cache_file = os.path.join(self.cache_dir, filename)
+            for entry in cache_entries:
+                cache_file = entry.path
                 metadata_file = cache_file + ".meta"
 
                 try:
-                    cache_stat = os.stat(cache_file)
+                    cache_stat = entry.stat()
                     stats["total_cache_files"] += 1
                     stats["total_size_bytes"] += cache_stat.st_size
 
@@ -379,8 +402,8 @@ class M3UCacheManager:
 
                     if os.path.exists(metadata_file):
                         try:
-                            with open(metadata_file, "r", encoding="utf-8") as f:
-                                metadata = json.load(f)
+                            with open(metadata_file, "rb") as f:
+                                metadata = json.loads(f.read())
                             entry_info.update(
                                 {
                                     "channel_count": metadata.get("channel_count", 0),
@@ -1,8 +1,82 @@
+import functools
+import itertools
+import logging
 import re
 import os
+import sys
 import time
 from .cache_manager import M3UCacheManager
 
+logger = logging.getLogger(__name__)
+
+# Precompiled pattern for the key="value" pairs in an #EXTINF attribute block
+_ATTR_RE = re.compile(r'([a-zA-Z0-9_-]+)=["\'](.*?)["\']')
+
+# Raw attribute key -> interned lowercase key. Playlists use a handful of
+# distinct keys, so every channel dict can share the same key objects.
+_ATTR_KEYS = {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_extinf(line):
+    """
+    Parses a #EXTINF line into a shared attribute dict (memoized).
+
+    Playlists often repeat the same #EXTINF line (one channel listed in
+    several groups, mirrors of a stream), so results are cached by line.
+    The returned dict is shared between calls and must not be mutated;
+    M3UParser._parse_extinf_line hands out copies.
+    """
+    info = {}
+    # Layout is "#EXTINF:<duration>[<whitespace><attributes>],<name>".
+    # The name starts after the first comma; everything before it is the
+    # header, split with plain string operations instead of a regex.
+    comma = line.find(",", 8)
+    header = line[8:comma]
+    if comma < 0 or not line.startswith("#EXTINF:") or header[:1].isspace():
+        logger.debug("Malformed #EXTINF line: %s", line)
+        return None  # Malformed
+
+    # Dispatch on whether the header carries an attribute block at all
+    parts = header.split(None, 1)
+    duration = parts[0] if parts else ""
+    digits = duration[1:] if duration.startswith("-") else duration
+    if not digits.isdecimal():
+        logger.debug("Malformed #EXTINF line: %s", line)
+        return None  # Malformed
+
+    info["duration"] = sys.intern(duration)
+    info["name"] = line[comma + 1 :].strip()  # This is the name after the comma
+
+    if len(parts) > 1:
+        attributes_str = parts[1]
+        attr_keys = _ATTR_KEYS
+        for key, value in _ATTR_RE.findall(attributes_str):
+            # Store keys in lowercase for consistency
+            lower_key = attr_keys.get(key)
+            if lower_key is None:
+                lower_key = sys.intern(key.lower())
+                if len(attr_keys) < 256:
+                    attr_keys[key] = lower_key
+            info[lower_key] = value
+
+    # Ensure tvg-name is present, fallback to name if not
+    if not info.get("tvg-name"):
+        info["tvg-name"] = info["name"]
+
+    # Default values for common fields if not found
+    info.setdefault("tvg-id", "")
+    info.setdefault("tvg-logo", "")
+
+    # Few distinct groups are shared by many channels; intern them so all
+    # channels (and the categories keys) reference a single string
+    group_title = info.get("group-title")
+    info["group-title"] = (
+        "Uncategorized" if group_title is None else sys.intern(group_title)
+    )
+
+    return info
+
 
 class M3UParser:
     """
@@ -14,6 +88,7 @@ class M3UParser:
         self.channels = []
         self.categories = {}  # Stores channels grouped by category title
         self.progress_callback = progress_callback
+        self._process_events = None  # Optional callable for UI event pumping
         self._should_cancel = False
 
         # Cache settings
@@ -22,9 +97,6 @@ class M3UParser:
 
         # Performance optimization settings
         self.chunk_size = 8192 * 4  # 32KB chunks for better I/O performance
-        self.progress_update_interval = (
-            100  # Update progress every 100 channels (more responsive)
-        )
         self.batch_size = 500  # Process channels in batches for memory efficiency
 
     def cancel_parsing(self):
@@ -47,17 +119,15 @@ class M3UParser:
         self._should_cancel = False
 
         try:
-            # Check if file exists
-            if not os.path.exists(filepath):
-                print(f"Error: File not found at {filepath}")
-                return [], {}
+            # A missing file surfaces as FileNotFoundError from open() below
 
             # Try to load from cache first (if enabled)
             if self.enable_cache and self.cache_manager:
                 cache_result = self.cache_manager.load_cache(filepath)
                 if cache_result is not None:
-                    print(
-                        f"Loading M3U data from cache for: {os.path.basename(filepath)}"
+                    logger.info(
+                        "Loading M3U data from cache for: %s",
+                        os.path.basename(filepath),
                     )
                     self.channels, self.categories = cache_result
 
@@ -68,13 +138,21 @@ class M3UParser:
                     return self.channels, self.categories
 
             # Cache miss or disabled - parse normally
-            print(f"Parsing M3U file: {os.path.basename(filepath)}")
-
-            # Get file size for progress calculation
-            file_size = os.path.getsize(filepath)
+            logger.info("Parsing M3U file: %s", os.path.basename(filepath))
 
             # Use binary mode for better performance with large files
             with open(filepath, "rb") as f:
+                # Get file size for progress calculation from the open handle,
+                # so it describes the file actually being read
+                file_size = os.fstat(f.fileno()).st_size
+
+                # Tell the kernel we'll read front-to-back so it can use
+                # aggressive read-ahead (POSIX only; a hint, so failures are fine)
+                if hasattr(os, "posix_fadvise"):
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
                 result = self._parse_content_with_progress(f, file_size)
 
             # Save to cache if enabled and parsing was successful
@@ -88,19 +166,20 @@ class M3UParser:
                     if self.cache_manager.save_cache(
                         filepath, self.channels, self.categories
                     ):
-                        print(
-                            f"Cached M3U data for future use: {os.path.basename(filepath)}"
+                        logger.info(
+                            "Cached M3U data for future use: %s",
+                            os.path.basename(filepath),
                         )
                 except Exception as e:
-                    print(f"Warning: Could not save cache: {e}")
+                    logger.warning("Could not save cache: %s", e)
 
             return result
 
         except FileNotFoundError:
-            print(f"Error: File not found at {filepath}")
+            logger.error("File not found at %s", filepath)
             return [], {}
         except Exception as e:
-            print(f"An error occurred while parsing the file: {e}")
+            logger.error("An error occurred while parsing the file: %s", e)
             return [], {}
 
     def set_process_events_callback(self, callback):
@@ -129,53 +208,69 @@ class M3UParser:
         current_channel_info = {}
         channels_processed = 0
         bytes_read = 0
-        last_progress_time = time.time()
+        last_progress_time = time.monotonic()
+        progress_callback = self.progress_callback
+        process_events = self._process_events
+        chunks_until_clock_check = 8
+
+        # Raw bytes of the trailing incomplete line from the previous chunk
+        pending = b""
 
-        # Buffer for incomplete lines
-        line_buffer = ""
+        # Bind hot-loop lookups to locals once instead of per line
+        parse_extinf_line = self._parse_extinf_line
+        append_channel = self.channels.append
+        decode = self._decode_lines
+        chunk_size = self.chunk_size
+        read = file_obj.read
 
         try:
-            # Read first chunk to check for #EXTM3U
-            first_chunk = file_obj.read(1024)
+            # The first chunk is checked for #EXTM3U, then parsed like any
+            # other chunk (no seek/re-read). A UTF-8 BOM would hide the
+            # header, so drop it up front.
+            first_chunk = read(chunk_size)
+            if first_chunk.startswith(b"\xef\xbb\xbf"):
+                first_chunk = first_chunk[3:]
             try:
-                first_chunk_text = first_chunk.decode("utf-8", errors="ignore")
-                if first_chunk_text and not first_chunk_text.strip().startswith(
-                    "#EXTM3U"
-                ):
-                    print(
-                        "Warning: File does not start with #EXTM3U. It might not be a valid M3U playlist."
+                head_text = first_chunk[:1024].decode("utf-8", errors="ignore")
+                if head_text and not head_text.strip().startswith("#EXTM3U"):
+                    logger.warning(
+                        "File does not start with #EXTM3U. "
+                        "It might not be a valid M3U playlist."
                     )
             except (UnicodeDecodeError, AttributeError):
                 pass
 
-            # Reset file position and start chunked reading
-            file_obj.seek(0)
+            # Read the rest in binary mode for performance
+            rest = iter(lambda: read(chunk_size), b"")
+            chunks = itertools.chain((first_chunk,), rest)
 
-            while True:
+            for chunk in chunks:
                 if self._should_cancel:
                     break
 
-                # Read chunk in binary mode for performance
-                chunk = file_obj.read(self.chunk_size)
                 if not chunk:
                     break
 
                 bytes_read += len(chunk)
 
-                # Decode chunk with error handling
+                # Frame lines on the raw bytes: b"\n" never occurs inside a
+                # multi-byte UTF-8 sequence, so cutting after the last newline
+                # never splits a character across chunks.
+                cut = chunk.rfind(b"\n") + 1
+                if not cut:
+                    pending += chunk
+                    continue
+                complete = pending + chunk[:cut] if pending else chunk[:cut]
+                pending = chunk[cut:]
+
+                # Decode only complete lines, once per chunk
                 try:
-                    chunk_text = chunk.decode("utf-8", errors="ignore")
+                    chunk_text = decode(complete)
                 except (UnicodeDecodeError, AttributeError):
                     # Skip problematic chunks
                     continue
 
-                # Combine with previous incomplete line
-                full_text = line_buffer + chunk_text
-                lines = full_text.split("\n")
-
-                # Keep the last potentially incomplete line for next iteration
-                line_buffer = lines[-1]
-                lines = lines[:-1]
+                lines = chunk_text.split("\n")
 
                 # Process complete lines in this chunk
                 for line in lines:
@@ -184,7 +279,7 @@ class M3UParser:
                         continue
 
                     if line.startswith("#EXTINF:"):
-                        current_channel_info = self._parse_extinf_line(line)
+                        current_channel_info = parse_extinf_line(line)
                     elif line.startswith("#EXTVLCOPT:") or line.startswith("#EXTGRP:"):
                         # Handle these tags if needed in the future
                         pass
@@ -193,50 +288,39 @@ class M3UParser:
                             current_channel_info
                         ):  # Ensure we have preceding #EXTINF info
                             current_channel_info["url"] = line
-                            self.channels.append(current_channel_info)
-
-                            group_title = current_channel_info.get(
-                                "group-title", "Uncategorized"
-                            )
-                            if group_title not in self.categories:
-                                self.categories[group_title] = []
-                            self.categories[group_title].append(current_channel_info)
-
+                            append_channel(current_channel_info)
                             current_channel_info = {}  # Reset for the next channel
                             channels_processed += 1
 
-                # Update progress more frequently (time-based + count-based)
-                current_time = time.time()
-                if self.progress_callback and (
-                    channels_processed % self.progress_update_interval == 0
-                    or current_time - last_progress_time > 0.5
-                ):  # Update every 500ms minimum
+                # Only look at the clock every few chunks (~256KB)
+                chunks_until_clock_check -= 1
+                if chunks_until_clock_check or not progress_callback:
+                    continue
+                chunks_until_clock_check = 8
 
+                current_time = time.monotonic()
+                if current_time - last_progress_time > 0.5:  # Update every 500ms
                     progress = min(100, int((bytes_read / file_size) * 100))
-                    self.progress_callback(progress, channels_processed)
+                    progress_callback(progress, channels_processed)
                     last_progress_time = current_time
 
                     # Allow Qt event processing to prevent UI freezing
-                    if hasattr(self, "_process_events"):
-                        self._process_events()
+                    if process_events is not None:
+                        process_events()
 
             # Process any remaining content in buffer
+            line_buffer = decode(pending)
             if line_buffer.strip() and not self._should_cancel:
                 line = line_buffer.strip()
                 if not line.startswith("#") and current_channel_info:
                     current_channel_info["url"] = line
                     self.channels.append(current_channel_info)
-
-                    group_title = current_channel_info.get(
-                        "group-title", "Uncategorized"
-                    )
-                    if group_title not in self.categories:
-                        self.categories[group_title] = []
-                    self.categories[group_title].append(current_channel_info)
                     channels_processed += 1
 
         except Exception as e:
-            print(f"Error during parsing: {e}")
+            logger.error("Error during parsing: %s", e)
+
+        self._build_categories()
 
         # Final progress update
         if self.progress_callback:
@@ -244,6 +328,28 @@ class M3UParser:
 
         return self.channels, self.categories
 
+    @staticmethod
+    def _decode_lines(data):
+        """
+        Decode a run of complete playlist lines read from disk.
+
+        Playlists are UTF-8 almost always, and stray invalid bytes are simply
+        dropped. Only when undecodable bytes outnumber the valid non-ASCII
+        characters, i.e. the text is really in a legacy 8-bit encoding, is it
+        decoded as latin-1 instead. Each chunk is judged on its own, so one bad
+        byte can't change how the rest of the file decodes.
+        """
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+        text = data.decode("utf-8", errors="replace")
+        invalid = text.count("\ufffd")
+        non_ascii = len(text) - len(text.encode("ascii", "ignore")) - invalid
+        if invalid > non_ascii:
+            return data.decode("latin-1")
+        return data.decode("utf-8", errors="ignore")
+
     def _parse_content(self, content_iterable):
         """
         Internal method to parse M3U content from an iterable (file object or list of lines).
@@ -253,15 +359,19 @@ class M3UParser:
         line_iter = iter(content_iterable)
 
         try:
-            first_line = next(line_iter).strip()
-            if not first_line.startswith("#EXTM3U"):
-                print(
-                    "Warning: File does not start with #EXTM3U. It might not be a valid M3U playlist."
-                )
+            first_line = next(line_iter)
         except StopIteration:
-            print("Warning: Empty M3U content.")
+            logger.warning("Empty M3U content.")
             return self.channels, self.categories
 
+        if not first_line.strip().startswith("#EXTM3U"):
+            logger.warning(
+                "File does not start with #EXTM3U. "
+                "It might not be a valid M3U playlist."
+            )
+            # Not a header, so put the peeked line back in front of the stream
+            line_iter = itertools.chain((first_line,), line_iter)
+
         for line in line_iter:
             line = line.strip()
             if not line:
@@ -275,68 +385,33 @@ class M3UParser:
                 if current_channel_info:  # Ensure we have preceding #EXTINF info
                     current_channel_info["url"] = line
                     self.channels.append(current_channel_info)
-
-                    group_title = current_channel_info.get(
-                        "group-title", "Uncategorized"
-                    )
-                    if group_title not in self.categories:
-                        self.categories[group_title] = []
-                    self.categories[group_title].append(current_channel_info)
-
                     current_channel_info = {}  # Reset for the next channel
 
+        self._build_categories()
         return self.channels, self.categories
 
+    def _build_categories(self):
+        """
+        Group the parsed channels by group-title in a single pass.
+        Categories keep the order in which their first channel appears.
+        """
+        categories = self.categories
+        get_bucket = categories.get
+        for channel in self.channels:
+            group_title = channel.get("group-title", "Uncategorized")
+            bucket = get_bucket(group_title)
+            if bucket is None:
+                bucket = categories[group_title] = []
+            bucket.append(channel)
+
     def _parse_extinf_line(self, line):
         """
         Parses a #EXTINF line to extract channel attributes.
         Example: #EXTINF:-1 tvg-id="BBC1.uk" tvg-name="UK: BBC 1 HD ◉" tvg-logo="http://logo.url" group-title="UK|NEWS",UK: BBC 1 HD ◉
         """
-        info = {}
-        # Regex to capture key-value pairs like tvg-id="value" and the trailing channel name
-        # It handles cases where values might be empty or contain various characters.
-        # The last part captures the channel name after the comma.
-        match = re.match(
-            r"#EXTINF:(?P<duration>-?\d+)(?:\s+(?P<attributes>.*?))?,(?P<name>.*)", line
-        )
-        if not match:
-            # Fallback for lines that might not have attributes or a comma
-            # e.g., #EXTINF:-1,Channel Name
-            simple_match = re.match(r"#EXTINF:(?P<duration>-?\d+),(?P<name>.*)", line)
-            if simple_match:
-                info["duration"] = simple_match.group("duration")
-                info["name"] = simple_match.group("name").strip()
-                info["tvg-name"] = info["name"]  # Use name as tvg-name if not present
-            else:
-                # If even the simple match fails, it's a malformed line.
-                # We might log this or return an empty dict.
-                # print(f"Warning: Malformed #EXTINF line: {line}")
-                return {}  # Return empty if malformed
-        else:
-            info["duration"] = match.group("duration")
-            info["name"] = match.group(
-                "name"
-            ).strip()  # This is the name after the comma
-
-            attributes_str = match.group("attributes")
-            if attributes_str:
-                # Regex for individual attributes: key="value"
-                attr_matches = re.findall(
-                    r'([a-zA-Z0-9_-]+)=["\'](.*?)["\']', attributes_str
-                )
-                for key, value in attr_matches:
-                    info[key.lower()] = value  # Store keys in lowercase for consistency
-
-            # Ensure tvg-name is present, fallback to name if not
-            if "tvg-name" not in info or not info["tvg-name"]:
-                info["tvg-name"] = info["name"]
-
-        # Default values for common fields if not found
-        info.setdefault("tvg-id", "")
-        info.setdefault("tvg-logo", "")
-        info.setdefault("group-title", "Uncategorized")
-
-        return info
+        info = _parse_extinf(line)
+        # Callers add the stream URL to the dict, so never hand out the cached one
+        return dict(info) if info is not None else {}
 
     def invalidate_cache(self, filepath):
         """
@@ -394,6 +469,7 @@ class M3UParser:
 
 if __name__ == "__main__":
     # Example Usage:
+    logging.basicConfig(level=logging.INFO)
     parser = M3UParser()
 
     # Create a dummy M3U file for testing
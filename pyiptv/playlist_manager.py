@@ -1,5 +1,7 @@
 import os
 import json
+import threading
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
@@ -8,10 +10,39 @@ from pyiptv.m3u_parser import M3UParser
 import requests
 from pyiptv.cache_manager import M3UCacheManager
 
+# Per-thread HTTP sessions for availability probes, so repeated probes against
+# the same provider reuse a pooled keep-alive connection instead of a new
+# TCP/TLS handshake each time. requests.Session isn't thread-safe, so each
+# thread gets its own (created on first use).
+_thread_local = threading.local()
+
+
+def _get_http_session() -> requests.Session:
+    """Return the calling thread's HTTP session, creating it on first use."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
 
 class PlaylistEntry:
     """Represents a single playlist entry with metadata."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "source",
+        "source_type",
+        "created_at",
+        "last_opened",
+        "channel_count",
+        "cached_file_path",
+        "_url_check",
+    )
+
+    # How long a remote availability probe result is reused, in seconds
+    URL_CHECK_TTL = 60.0
+
     def __init__(
         self,
         name: str,
@@ -33,6 +64,7 @@ class PlaylistEntry:
         self.cached_file_path = (
             cached_file_path  # For URL playlists, path to cached local file
         )
+        self._url_check = None  # (monotonic time, result) of last URL probe
 
     def to_dict(self) -> dict:
         """Convert playlist entry to dictionary for serialization."""
@@ -73,14 +105,35 @@ class PlaylistEntry:
             # For URL playlists, check if we have a cached file first
             if self.cached_file_path and os.path.exists(self.cached_file_path):
                 return True
-            # Otherwise check if the URL is accessible
+            # Otherwise check if the URL is accessible, reusing a recent result
+            # so list repaints don't hit the network every time
+            now = time.monotonic()
+            if self._url_check and now - self._url_check[0] < self.URL_CHECK_TTL:
+                return self._url_check[1]
             try:
-                response = requests.head(self.source, timeout=5)
-                return response.status_code == 200
+                # Ask for a single byte: many IPTV servers reject or mishandle
+                # HEAD, and a ranged GET avoids pulling the playlist body.
+                with _get_http_session().get(
+                    self.source,
+                    timeout=5,
+                    stream=True,
+                    headers={"Range": "bytes=0-0"},
+                ) as response:
+                    result = response.status_code in (200, 206)
+                    if response.status_code == 206:
+                        # Drain the single byte; an unread streamed response
+                        # is closed instead of returning to the pool
+                        response.content
             except (requests.RequestException, OSError):
-                return False
+                result = False
+            self._url_check = (now, result)
+            return result
         return False
 
+    def invalidate_availability(self):
+        """Forget the cached URL availability so the next check probes again."""
+        self._url_check = None
+
     def get_effective_path(self) -> str:
         """Get the effective file path to use for parsing."""
         if self.source_type == "file":
@@ -163,9 +216,11 @@ class PlaylistManager(QObject):
         self.playlists: Dict[str, PlaylistEntry] = {}
         self._playlists_file = self._get_playlists_file_path()
 
-        # Initialize cache manager with the playlist cache directory
-        cache_dir = self._get_cache_directory()
-        self.cache_manager = M3UCacheManager(cache_dir)
+        # Initialize cache manager with the playlist cache directory. The
+        # directory (and with it the settings directory holding
+        # playlists.json) is created once here rather than on every use.
+        self._cache_dir = self._get_cache_directory()
+        self.cache_manager = M3UCacheManager(self._cache_dir)
 
         self.load_playlists()
 
@@ -184,8 +239,7 @@ class PlaylistManager(QObject):
 
     def _get_cached_file_path(self, playlist_id: str) -> str:
         """Get the cached file path for a playlist."""
-        cache_dir = self._get_cache_directory()
-        return os.path.join(cache_dir, f"{playlist_id}.m3u8")
+        return os.path.join(self._cache_dir, f"{playlist_id}.m3u8")
 
     def add_playlist(
         self, name: str, source: str, source_type: str = "file"
@@ -257,6 +311,7 @@ class PlaylistManager(QObject):
         playlist.source = new_source
         if new_source_type:
             playlist.source_type = new_source_type
+        playlist.invalidate_availability()
 
         self.save_playlists()
         self.playlist_updated.emit(playlist)
@@ -299,15 +354,20 @@ class PlaylistManager(QObject):
             # For file-based playlists, we just need to update the channel count
             # and last opened time since the file is accessed directly
             if os.path.exists(playlist.source):
-                # Read and parse the playlist to update channel count
+                # Read and parse the playlist to update channel count. Parsing
+                # from the file streams it in binary chunks with encoding
+                # detection and reuses the parse cache when it's unchanged.
                 try:
+                    # The parser logs read errors and returns ([], {}) rather
+                    # than raising, which would look like an empty playlist.
+                    # Open the file here first so a directory or unreadable
+                    # path fails the refresh (keeping the old count), while a
+                    # playlist that really has no channels still reports 0.
+                    with open(playlist.source, "rb"):
+                        pass
 
                     parser = M3UParser()
-                    with open(playlist.source, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-                    content_lines = content.splitlines()
-                    channels, _ = parser.parse_m3u_from_content(content_lines)
+                    channels, _ = parser.parse_m3u_from_file(playlist.source)
                     playlist.channel_count = len(channels)
 
                     # Update last opened to current time to mark the refresh
@@ -342,6 +402,7 @@ class PlaylistManager(QObject):
         """Validate all playlists and return list of unavailable playlist IDs."""
         unavailable = []
         for playlist_id, playlist in self.playlists.items():
+            playlist.invalidate_availability()
             if not playlist.is_available():
                 unavailable.append(playlist_id)
         return unavailable
@@ -493,49 +554,56 @@ class PlaylistManager(QObject):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
 
-            response = requests.get(url, timeout=timeout, stream=True, headers=headers)
-            response.raise_for_status()
-
-            # Check content type
-            content_type = response.headers.get("content-type", "").lower()
-            if "text" not in content_type and "application" not in content_type:
-                raise ValueError("Invalid content type for M3U playlist")
-
-            # Get total file size if available
-            total_size = int(response.headers.get("content-length", 0))
-
-            # Read content with size limit (500MB max)
-            max_size = 500 * 1024 * 1024  # 500MB
-            content_bytes = b""
-            downloaded_size = 0
-
-            # Read as bytes first, then decode (using larger chunks for better speed)
-            for chunk in response.iter_content(chunk_size=262144 * 4):  # 1M chunks
-                if chunk:
-                    downloaded_size += len(chunk)
-                    if downloaded_size > max_size:
-                        raise ValueError("Playlist file too large (>500MB)")
-                    content_bytes += chunk
-
-                    # Report progress if callback provided
-                    if progress_callback and total_size > 0:
-                        progress = min(int((downloaded_size / total_size) * 100), 100)
-                        progress_callback(progress)
-                    elif progress_callback:
-                        # If no total size, report progress based on downloaded size
-                        # Use a logarithmic scale to show some progress
-                        mb_downloaded = downloaded_size / (1024 * 1024)
-                        progress = min(
-                            int(30 + (mb_downloaded / 10) * 40), 90
-                        )  # 30-90% range
-                        progress_callback(progress)
+            # Each download runs on its own worker thread, so a per-thread
+            # session would be used once and never closed; use a session for
+            # just this download and close it (and the response) when done.
+            with requests.Session() as session, session.get(
+                url, timeout=timeout, stream=True, headers=headers
+            ) as response:
+                response.raise_for_status()
+
+                # Check content type
+                content_type = response.headers.get("content-type", "").lower()
+                if "text" not in content_type and "application" not in content_type:
+                    raise ValueError("Invalid content type for M3U playlist")
+
+                # Get total file size if available
+                total_size = int(response.headers.get("content-length", 0))
+
+                # Read content with size limit (500MB max)
+                max_size = 500 * 1024 * 1024  # 500MB
+                content_bytes = bytearray()
+                downloaded_size = 0
+
+                # Read as bytes first, then decode (larger chunks for better speed)
+                for chunk in response.iter_content(chunk_size=262144 * 4):  # 1M chunks
+                    if chunk:
+                        downloaded_size += len(chunk)
+                        if downloaded_size > max_size:
+                            raise ValueError("Playlist file too large (>500MB)")
+                        content_bytes += chunk  # amortized append, no re-copy
+
+                        # Report progress if callback provided
+                        if progress_callback and total_size > 0:
+                            progress = min(
+                                int((downloaded_size / total_size) * 100), 100
+                            )
+                            progress_callback(progress)
+                        elif progress_callback:
+                            # No total size, report progress based on downloaded size
+                            # Use a logarithmic scale to show some progress
+                            mb_downloaded = downloaded_size / (1024 * 1024)
+                            progress = min(
+                                int(30 + (mb_downloaded / 10) * 40), 90
+                            )  # 30-90% range
+                            progress_callback(progress)
 
             # Decode the content to string
             try:
                 content = content_bytes.decode("utf-8")
             except UnicodeDecodeError:
                 # Try other common encodings
-                for encoding in ["latin1", "cp1252", "iso-8859-1"]:
+                for encoding in ("latin1", "cp1252", "iso-8859-1"):
                     try:
                         content = content_bytes.decode(encoding)
                         break
@@ -559,11 +627,15 @@ class PlaylistManager(QObject):
                 "last_updated": datetime.now().isoformat(),
             }
 
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self._playlists_file), exist_ok=True)
+            # Serialize in one go and write once; json.dump issues many small
+            # writes through the text layer.
+            payload = json.dumps(data, indent=2, ensure_ascii=False)
 
-            with open(self._playlists_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and swap it in atomically
+            tmp_path = self._playlists_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._playlists_file)
 
         except Exception as e:
             print(f"Error saving playlists: {e}")
@@ -576,14 +648,14 @@ class PlaylistManager(QObject):
                 self.playlists_loaded.emit()
                 return
 
-            with open(self._playlists_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self._playlists_file, "rb") as f:
+                data = json.loads(f.read())
 
             # Load playlists
-            self.playlists = {}
-            for playlist_data in data.get("playlists", []):
-                playlist = PlaylistEntry.from_dict(playlist_data)
-                self.playlists[playlist.id] = playlist
+            self.playlists = {
+                playlist.id: playlist
+                for playlist in map(PlaylistEntry.from_dict, data.get("playlists", []))
+            }
 
             self.playlists_loaded.emit()
 
@@ -618,20 +690,22 @@ class PlaylistManager(QObject):
 
             imported_count = 0
             skipped_count = 0
+            existing_names = {p.name.lower() for p in self.playlists.values()}
 
             for playlist_data in data.get("playlists", []):
                 try:
                     playlist = PlaylistEntry.from_dict(playlist_data)
 
                     # Check if playlist with same name already exists
-                    existing_names = [p.name.lower() for p in self.playlists.values()]
-                    if playlist.name.lower() in existing_names:
+                    name_key = playlist.name.lower()
+                    if name_key in existing_names:
                         skipped_count += 1
                         continue
 
                     # Generate new ID to avoid conflicts
                     playlist.id = str(uuid.uuid4())
                     self.playlists[playlist.id] = playlist
+                    existing_names.add(name_key)
                     imported_count += 1
 
                 except Exception as e:
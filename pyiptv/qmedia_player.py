@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from PySide6.QtCore import QObject, Signal, QUrl, QTimer, Qt
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimedia import QMediaMetaData
@@ -7,6 +9,14 @@ class QMediaVideoPlayer(QObject):
     playback_error_occurred = Signal(str)
     metadata_updated = Signal(dict)  # Signal for metadata updates
 
+    ERROR_MESSAGES = {
+        QMediaPlayer.Error.NoError: "No error",
+        QMediaPlayer.Error.ResourceError: "Resource error - unable to resolve media source",
+        QMediaPlayer.Error.FormatError: "Format error - media format not supported",
+        QMediaPlayer.Error.NetworkError: "Network error - network connection failed",
+        QMediaPlayer.Error.AccessDeniedError: "Access denied - insufficient permissions",
+    }
+
     def __init__(self, video_widget=None):
         """
         Initialize QMediaPlayer-based video player.
@@ -48,10 +58,14 @@ class QMediaVideoPlayer(QObject):
         # Current media URL for reference
         self.current_url = None
 
-        # Timer to periodically check for metadata updates
+        # Timer to periodically check for metadata updates while media is
+        # playing; started by play_media()/play() and stopped with playback.
+        # Coarse accuracy is plenty for a 2 second poll and lets the OS batch
+        # the wakeups.
         self.metadata_timer = QTimer()
+        self.metadata_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.metadata_timer.setInterval(2000)  # Check every 2 seconds
         self.metadata_timer.timeout.connect(self._check_metadata)
-        self.metadata_timer.start(2000)  # Check every 2 seconds
 
         # Store current metadata
         self.current_metadata = {}
@@ -90,6 +104,7 @@ class QMediaVideoPlayer(QObject):
         self.current_url = media_url
         self.player.setSource(QUrl(media_url))
         self.player.play()
+        self.metadata_timer.start()
         print(f"Playing: {media_url}")
 
     def play(self):
@@ -97,6 +112,7 @@ class QMediaVideoPlayer(QObject):
         if self.player is None:
             return
         self.player.play()
+        self.metadata_timer.start()
 
     def pause(self):
         """Pause the current media."""
@@ -109,6 +125,7 @@ class QMediaVideoPlayer(QObject):
         if self.player is None:
             return
         self.player.stop()
+        self.metadata_timer.stop()
         self.current_url = None
 
     def set_volume(self, volume):
@@ -154,10 +171,8 @@ class QMediaVideoPlayer(QObject):
     def get_current_time_str(self):
         """Returns current time as H:M:S string."""
         ms = self.get_current_time()
-        seconds = ms // 1000
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
+        hours, seconds = divmod(ms // 1000, 3600)
+        minutes, seconds = divmod(seconds, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     def get_duration_str(self):
@@ -165,10 +180,8 @@ class QMediaVideoPlayer(QObject):
         ms = self.get_duration()
         if ms <= 0:
             return "00:00:00"
-        seconds = ms // 1000
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
+        hours, seconds = divmod(ms // 1000, 3600)
+        minutes, seconds = divmod(seconds, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     def set_position(self, position_float):
@@ -201,6 +214,7 @@ class QMediaVideoPlayer(QObject):
 
     def release_player(self):
         """Release player resources."""
+        self.metadata_timer.stop()
         if self.player:
             self.player.stop()
             self.player = None
@@ -208,21 +222,13 @@ class QMediaVideoPlayer(QObject):
 
     def _handle_error(self, error, error_string):
         """Handle QMediaPlayer errors with AC3-specific guidance."""
-        error_messages = {
-            QMediaPlayer.Error.NoError: "No error",
-            QMediaPlayer.Error.ResourceError: "Resource error - unable to resolve media source",
-            QMediaPlayer.Error.FormatError: "Format error - media format not supported",
-            QMediaPlayer.Error.NetworkError: "Network error - network connection failed",
-            QMediaPlayer.Error.AccessDeniedError: "Access denied - insufficient permissions",
-        }
-
-        error_message = error_messages.get(error, f"Unknown error: {error}")
+        error_message = self.ERROR_MESSAGES.get(error, f"Unknown error: {error}")
         if error_string:
             error_message += f" - {error_string}"
 
         # Add AC3-specific guidance for format errors
         if error == QMediaPlayer.Error.FormatError and error_string:
-            if any(codec in error_string.lower() for codec in ["ac3", "ac-3", "dolby"]):
+            if any(codec in error_string.lower() for codec in ("ac3", "ac-3", "dolby")):
                 error_message += "\nHint: AC3 audio codec issue detected. Try installing additional codecs or check audio settings."
 
         print(f"QMediaPlayer error: {error_message}")
@@ -341,7 +347,7 @@ class QMediaVideoPlayer(QObject):
 
                     # Sample rate - check multiple possible attribute names
                     sample_rate = None
-                    for attr_name in ["SampleRate", "AudioSampleRate", "SamplingRate"]:
+                    for attr_name in ("SampleRate", "AudioSampleRate", "SamplingRate"):
                         if hasattr(QMediaMetaData.Key, attr_name):
                             try:
                                 sample_rate = meta_data.value(
@@ -412,8 +418,8 @@ class QMediaVideoPlayer(QObject):
                 print(f"Error extracting metadata: {e}")
 
     def get_metadata(self):
-        """Get current metadata as dictionary."""
-        return self.current_metadata.copy()
+        """Get current metadata as a read-only mapping (no per-call copy)."""
+        return MappingProxyType(self.current_metadata)
 
     def get_audio_tracks(self):
         """Get available audio tracks with raw information."""
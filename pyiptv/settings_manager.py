@@ -127,14 +127,15 @@ class SettingsManager:
     def save_settings(self):
         """Saves the current settings to the JSON file."""
         try:
-            # Ensure the directory exists before writing
-            os.makedirs(os.path.dirname(self.settings_filepath), exist_ok=True)
-
             # Create a copy of settings with any bytes objects converted to strings
             safe_settings = self._make_json_safe(self.settings)
 
-            with open(self.settings_filepath, "w") as f:
+            # Write to a temp file and swap it in so a crash mid-write can't
+            # leave a truncated settings file behind
+            tmp_path = self.settings_filepath + ".tmp"
+            with open(tmp_path, "w") as f:
                 json.dump(safe_settings, f, indent=4)
+            os.replace(tmp_path, self.settings_filepath)
         except Exception as e:
             print(f"Error saving settings to {self.settings_filepath}: {e}")
 
@@ -170,11 +171,20 @@ class SettingsManager:
     def set_setting(self, key, value):
         """
         Updates a specific setting and saves all settings.
+        Skips the write when the stored value is already equal.
 
         Args:
             key (str): The key of the setting to update.
             value: The new value for the setting.
         """
+        if key in self.settings:
+            current = self.settings[key]
+            # The same mutable object may have been modified in place, so only
+            # an equal but distinct value counts as unchanged.
+            if current == value and (
+                current is not value or not isinstance(value, (list, dict))
+            ):
+                return
         self.settings[key] = value
         self.save_settings()
 
@@ -165,6 +165,9 @@ class EnhancedControlBar(QWidget):
 
     def update_play_state(self, is_playing):
         """Update the play/pause button state."""
+        # Called on every player state tick; only touch the button on changes
+        if is_playing == self.is_playing:
+            return
         self.is_playing = is_playing
         if is_playing:
             self.play_pause_btn.setIcon(QIcon.fromTheme("media-playback-pause"))
@@ -207,10 +210,8 @@ class EnhancedControlBar(QWidget):
             return "00:00"
 
         # Convert to int to ensure we're working with integers
-        total_seconds = int(ms // 1000)
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        hours, seconds = divmod(int(ms // 1000), 3600)
+        minutes, seconds = divmod(seconds, 60)
 
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
@@ -1,5 +1,4 @@
 from PySide6.QtCore import QObject, QThread, Signal
-from PySide6.QtWidgets import QApplication
 from typing import Optional, Any, Dict
 
 
@@ -17,14 +16,16 @@ class BackgroundOperation(QThread):
         self._should_cancel = False
         self.operation_id: Optional[str] = None
         self.start_time = None
+        self._last_status: Optional[str] = None
 
     def is_cancelled(self) -> bool:
         """Check if operation was cancelled."""
         return self._should_cancel
 
     def emit_status(self, status: str):
-        """Emit status update."""
-        if not self._should_cancel:
+        """Emit status update, skipping repeats of the last message."""
+        if not self._should_cancel and status != self._last_status:
+            self._last_status = status
             self.status_updated.emit(status)
 
     def emit_completion(self, success: bool, message: str = "", result: Any = None):
@@ -69,12 +70,6 @@ class SimplifiedM3UParseOperation(BackgroundOperation):
                 progress_callback=progress_callback, enable_cache=self.enable_cache
             )
 
-            # Set up Qt event processing
-            def process_events():
-                QApplication.processEvents()
-
-            self.parser.set_process_events_callback(process_events)
-
             # Check for cache
             if self.enable_cache:
                 cache_info = self.parser.get_cache_info(self.filepath)
@@ -134,19 +129,9 @@ class SimplifiedURLDownloadOperation(BackgroundOperation):
             self.emit_status("Saving playlist...")
 
             # Create temporary file
-            import tempfile
-            import os
-            import uuid
-            from urllib.parse import urlparse
-
-            temp_dir = tempfile.gettempdir()
-            parsed_url = urlparse(self.url)
-            filename = os.path.basename(parsed_url.path) or "playlist"
-            if not filename.endswith((".m3u", ".m3u8")):
-                filename += ".m3u8"
+            from ..url_download_worker import make_temp_playlist_path
 
-            unique_filename = f"{uuid.uuid4().hex[:8]}_{filename}"
-            temp_file_path = os.path.join(temp_dir, unique_filename)
+            temp_file_path = make_temp_playlist_path(self.url)
 
             with open(temp_file_path, "w", encoding="utf-8") as f:
                 f.write(content)
@@ -256,7 +241,8 @@ class SimplifiedOperationManager(QObject):
 
     def cancel_all_operations(self):
         """Cancel all active operations."""
-        for operation_id, operation in list(self.active_operations.items()):
+        # Flagging doesn't touch the dict, so iterate it directly and clear after
+        for operation in self.active_operations.values():
             operation._should_cancel = True
         self.active_operations.clear()
         self.status_manager.show_info("Operations cancelled")
@@ -1,7 +1,8 @@
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QSizePolicy
 from PySide6.QtCore import QObject, Signal, QTimer, QPropertyAnimation, QByteArray
 import time
-from typing import Optional, List
+from collections import deque
+from typing import Optional, Deque
 from enum import Enum
 
 
@@ -15,9 +16,23 @@ class StatusLevel(Enum):
     LOADING = "loading"
 
 
+# Levels that hold the status bar; new messages queue behind them
+_BLOCKING_LEVELS = frozenset({StatusLevel.LOADING, StatusLevel.ERROR})
+
+
 class StatusMessage:
     """Represents a status message."""
 
+    __slots__ = (
+        "text",
+        "level",
+        "timeout",
+        "actionable",
+        "action_text",
+        "timestamp",
+        "id",
+    )
+
     def __init__(
         self,
         text: str,
@@ -45,7 +60,8 @@ class UnifiedStatusBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_message: Optional[StatusMessage] = None
-        self.message_queue: List[StatusMessage] = []
+        # FIFO with O(1) popleft; unbounded so queued messages are never dropped
+        self.message_queue: Deque[StatusMessage] = deque()
         self.auto_dismiss_timer = QTimer()
         self.auto_dismiss_timer.timeout.connect(self._auto_dismiss)
         self.init_ui()
@@ -115,10 +131,7 @@ class UnifiedStatusBar(QWidget):
         message = StatusMessage(text, level, timeout, actionable, action_text)
 
         # If there's a current message, queue this one
-        if self.current_message and self.current_message.level in [
-            StatusLevel.LOADING,
-            StatusLevel.ERROR,
-        ]:
+        if self.current_message and self.current_message.level in _BLOCKING_LEVELS:
             self.message_queue.append(message)
             return message.id
 
@@ -189,7 +202,7 @@ class UnifiedStatusBar(QWidget):
             self.action_button.setVisible(False)
 
         # Handle dismiss button
-        dismissible = message.level not in [StatusLevel.LOADING]
+        dismissible = message.level is not StatusLevel.LOADING
         self.dismiss_button.setVisible(dismissible)
 
         # Handle auto-dismiss
@@ -313,7 +326,7 @@ class UnifiedStatusBar(QWidget):
 
             # Show next message in queue or default
             if self.message_queue:
-                next_message = self.message_queue.pop(0)
+                next_message = self.message_queue.popleft()
                 self._display_message(next_message)
             else:
                 self._show_default_message()
@@ -16,6 +16,14 @@ class VideoPlaceholder(QWidget):
     Features animated elements and helpful information.
     """
 
+    # Keyboard hints drawn bottom-up in the lower left corner on every repaint
+    SHORTCUT_HINTS = (
+        "F11 - Fullscreen",
+        "Ctrl+O - Open M3U",
+        "Ctrl+F - Search channels",
+        "Space - Play/Pause",
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(320, 240)
@@ -30,8 +38,8 @@ class VideoPlaceholder(QWidget):
         # Setup UI
         self.setup_ui()
 
-        # Start animations
-        self.start_animations()
+        # Animations are started by showEvent and stopped by hideEvent, so
+        # the 50ms timer only runs while the placeholder is on screen
 
     def setup_ui(self):
         """Setup the placeholder UI elements."""
@@ -204,15 +212,8 @@ class VideoPlaceholder(QWidget):
         painter.setPen(QColor(120, 120, 120, int(150 * self._pulse_opacity)))
 
         # Bottom left shortcuts
-        shortcuts = [
-            "F11 - Fullscreen",
-            "Ctrl+O - Open M3U",
-            "Ctrl+F - Search channels",
-            "Space - Play/Pause",
-        ]
-
         y_offset = height - 20
-        for i, shortcut in enumerate(shortcuts):
+        for i, shortcut in enumerate(self.SHORTCUT_HINTS):
             painter.drawText(10, y_offset - (i * 15), shortcut)
 
         # Bottom right info
@@ -28,6 +28,8 @@ class VirtualizedChannelList(QWidget):
         self._all_channels = []
         self._filtered_channels = []
         self._filtered_indices = []  # Maps filtered index to original index
+        self._search_texts = None  # Lazily built lowercased search text per channel
+        self._last_search_term = ""  # Term that produced _filtered_indices
 
         # Display settings
         self.item_height = 24
@@ -105,6 +107,8 @@ class VirtualizedChannelList(QWidget):
     def set_channels(self, channels):
         """Set the channel data."""
         self._all_channels = channels
+        self._search_texts = None  # Channel data changed, rebuild on next search
+        self._last_search_term = ""
         self._apply_search_filter()
         self._update_info_label()
 
@@ -134,27 +138,28 @@ class VirtualizedChannelList(QWidget):
 
     def _apply_search_filter(self):
         """Apply the current search filter."""
-        if not self.search_term:
+        search_term = self.search_term
+        if not search_term:
             self._filtered_channels = self._all_channels
-            self._filtered_indices = list(range(len(self._all_channels)))
+            # Identity mapping; a range avoids building a list of every index
+            self._filtered_indices = range(len(self._all_channels))
         else:
-            self._filtered_channels = []
-            self._filtered_indices = []
+            search_texts = self._get_search_texts()
 
-            for i, channel in enumerate(self._all_channels):
-                # Search in multiple fields for better matching
-                searchable_text = []
-                searchable_text.append(channel.get("name", ""))
-                searchable_text.append(channel.get("tvg-name", ""))
-                searchable_text.append(channel.get("group-title", ""))
-                searchable_text.append(channel.get("tvg-id", ""))
+            # When the user keeps typing, the new matches are a subset of the
+            # previous ones, so only those need to be checked again.
+            if self._last_search_term and self._last_search_term in search_term:
+                candidates = self._filtered_indices
+            else:
+                candidates = range(len(search_texts))
 
-                # Combine all searchable text
-                combined_text = " ".join(searchable_text).lower()
+            all_channels = self._all_channels
+            self._filtered_indices = [
+                i for i in candidates if search_term in search_texts[i]
+            ]
+            self._filtered_channels = [all_channels[i] for i in self._filtered_indices]
 
-                if self.search_term in combined_text:
-                    self._filtered_channels.append(channel)
-                    self._filtered_indices.append(i)
+        self._last_search_term = search_term
 
         # Reset selection and scroll position
         self.selected_index = -1
@@ -166,6 +171,27 @@ class VirtualizedChannelList(QWidget):
         self._update_info_label()
         self.viewport.update()
 
+    def _get_search_texts(self):
+        """Return the lowercased searchable text for every channel.
+
+        The list is built once per channel set and reused by every search
+        until set_channels() replaces the data.
+        """
+        if self._search_texts is None:
+            # Search in multiple fields for better matching
+            self._search_texts = [
+                " ".join(
+                    (
+                        channel.get("name", ""),
+                        channel.get("tvg-name", ""),
+                        channel.get("group-title", ""),
+                        channel.get("tvg-id", ""),
+                    )
+                ).lower()
+                for channel in self._all_channels
+            ]
+        return self._search_texts
+
     def _update_scrollbar(self):
         """Update scrollbar range and visibility."""
         total_items = len(self._filtered_channels)
@@ -34,8 +34,10 @@ from pyiptv.ui.components.enhanced_controls import EnhancedControlBar
 from pyiptv.ui.components.unified_status_system import UnifiedStatusBar, StatusManager
 from pyiptv.ui.components.simplified_operations import SimplifiedOperationManager
 from pyiptv.ui.themes import ModernDarkTheme
+from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
 import os
+import shutil
 from pathlib import Path
 
 # Get the directory containing this file
@@ -179,6 +181,7 @@ class MainWindow(QMainWindow):
         self.playlist_manager = PlaylistManager(self.settings_manager)
         self.all_channels_data = []
         self.categories_data = {}
+        self._sorted_category_keys = []  # (name, lowercased name), sorted by name
 
         # Use provided playlist path or fall back to settings
         if playlist_path:
@@ -374,12 +377,19 @@ class MainWindow(QMainWindow):
         if hasattr(self.player, "metadata_updated"):
             self.player.metadata_updated.connect(self._on_metadata_updated)
 
-        # Timer to update UI based on player state (e.g., play/pause icon)
+        # Coalesce volume slider changes into a single settings write
+        self._pending_volume = None  # Last volume not yet persisted
+        self.volume_save_timer = QTimer(self)
+        self.volume_save_timer.setSingleShot(True)
+        self.volume_save_timer.timeout.connect(self._save_volume_setting)
+
+        # Timer to update UI based on player state (e.g., play/pause icon).
+        # Only runs while media is playing; see play_channel/stop_playback.
         self.player_state_timer = QTimer(self)
-        self.player_state_timer.timeout.connect(self.update_player_ui_state)
-        self.player_state_timer.start(
+        self.player_state_timer.setInterval(
             250
         )  # More frequent updates for smoother progress
+        self.player_state_timer.timeout.connect(self.update_player_ui_state)
 
         # Set initial volume from settings
         initial_volume = self.settings_manager.get_setting("volume")
@@ -434,6 +444,7 @@ class MainWindow(QMainWindow):
     def _on_playback_error(self, error_message):
         """Handles playback errors signaled by the media player."""
         self.status_manager.show_error(f"Playback Error: {error_message}")
+        self.player_state_timer.stop()
         self.control_bar.update_play_state(
             False
         )  # Update button to "Play" as playback likely stopped
@@ -517,19 +528,14 @@ class MainWindow(QMainWindow):
             if not playlist_entry:
                 raise ValueError("No playlist entry found for caching")
 
-            # Read the downloaded content
-            with open(temp_file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
             # Cache the playlist using the playlist manager
             if not playlist_entry.cached_file_path:
                 playlist_entry.cached_file_path = (
                     self.playlist_manager._get_cached_file_path(playlist_entry.id)
                 )
 
-            # Save content to cache file
-            with open(playlist_entry.cached_file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Stream the downloaded file into the cache file
+            shutil.copyfile(temp_file_path, playlist_entry.cached_file_path)
 
             # Update playlist manager
             self.playlist_manager.save_playlists()
@@ -602,6 +608,7 @@ class MainWindow(QMainWindow):
 
         self.all_channels_data = all_channels
         self.categories_data = categories
+        self._sorted_category_keys = [(cat, cat.lower()) for cat in sorted(categories)]
         hidden_cats = self.settings_manager.get_setting("hidden_categories")
         self.hidden_categories = set(hidden_cats if hidden_cats is not None else [])
 
@@ -650,14 +657,14 @@ class MainWindow(QMainWindow):
         )  # Special key
         self.category_list_widget.addItem(all_channels_item)
 
-        # Filter and sort categories
-        filtered_categories = []
-        for cat in self.categories_data.keys():
-            if cat not in self.hidden_categories:
-                if not search_term or search_term in cat.lower():
-                    filtered_categories.append(cat)
-
-        sorted_categories = sorted(filtered_categories)
+        # Filter the pre-sorted, pre-lowercased categories
+        hidden_categories = self.hidden_categories
+        sorted_categories = [
+            cat
+            for cat, cat_lower in self._sorted_category_keys
+            if cat not in hidden_categories
+            and (not search_term or search_term in cat_lower)
+        ]
         for category_name in sorted_categories:
             item = QListWidgetItem(category_name)
             item.setData(
@@ -747,6 +754,7 @@ class MainWindow(QMainWindow):
 
             # Update UI
             self.control_bar.update_play_state(True)
+            self.player_state_timer.start()
 
             # Hide loading state after a short delay
             QTimer.singleShot(2000, lambda: self.show_loading_state(False))
@@ -756,12 +764,14 @@ class MainWindow(QMainWindow):
     def toggle_play_pause(self):
         if self.player.is_playing():
             self.player.pause()
+            self.player_state_timer.stop()
             self.control_bar.update_play_state(False)
             self.status_manager.show_info("Paused", timeout=2000)
         else:
             # Check if there's media loaded
             if self.player.current_url:
                 self.player.play()
+                self.player_state_timer.start()
                 self.control_bar.update_play_state(True)
                 self.video_stack.setCurrentIndex(1)  # Ensure video widget is shown
                 self.status_manager.show_info("Playing...", timeout=2000)
@@ -778,6 +788,7 @@ class MainWindow(QMainWindow):
 
     def stop_playback(self):
         self.player.stop()
+        self.player_state_timer.stop()
         self.control_bar.update_play_state(False)
         self.video_stack.setCurrentIndex(0)  # Show placeholder
 
@@ -800,18 +811,31 @@ class MainWindow(QMainWindow):
                 duration = self.player.get_duration()
                 self.control_bar.update_time(position, duration)
 
+                # Media ended (current_url stays set); nothing left to poll
+                if self.player.get_state() == QMediaPlayer.PlaybackState.StoppedState:
+                    self.player_state_timer.stop()
+
                 # Show video widget if playing
                 if is_playing and self.video_stack.currentIndex() != 1:
                     self.video_stack.setCurrentIndex(1)
             else:
-                # No media loaded, show placeholder
+                # No media loaded, show placeholder and stop polling
+                self.player_state_timer.stop()
                 if self.video_stack.currentIndex() != 0:
                     self.video_stack.setCurrentIndex(0)
 
     def on_volume_changed(self, volume):
         """Handle volume changes from control bar."""
         self.player.set_volume(volume)
-        self.settings_manager.set_setting("volume", volume)
+        self._pending_volume = volume
+        self.volume_save_timer.start(500)
+
+    def _save_volume_setting(self):
+        """Persist the last volume set by the user."""
+        volume = self._pending_volume
+        if volume is not None:
+            self._pending_volume = None
+            self.settings_manager.set_setting("volume", volume)
 
     def on_seek_requested(self, position):
         """Handle seek requests from control bar."""
@@ -1048,6 +1072,8 @@ class MainWindow(QMainWindow):
             self.exit_fullscreen()
 
         # Stop and cleanup player
+        if hasattr(self, "player_state_timer"):
+            self.player_state_timer.stop()
         if hasattr(self, "player") and self.player:
             self.player.stop()
             self.player.release_player()
@@ -1057,6 +1083,9 @@ class MainWindow(QMainWindow):
             self.operation_manager.cancel_all_operations()
 
         # Save settings
+        if hasattr(self, "volume_save_timer"):
+            self.volume_save_timer.stop()
+            self._save_volume_setting()
         self.save_geometry()
 
     def closeEvent(self, event):
@@ -1,4 +1,5 @@
 import os
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -613,19 +614,12 @@ class PlaylistManagerWindow(QMainWindow):
                         "url",  # Keep as URL type
                     )
 
-                    # Read the downloaded content and cache it
+                    # Stream the downloaded content into the cache file
                     try:
-                        with open(
-                            dialog.temp_downloaded_file, "r", encoding="utf-8"
-                        ) as f:
-                            content = f.read()
-
-                        # Save to cache file
                         if playlist.cached_file_path:
-                            with open(
-                                playlist.cached_file_path, "w", encoding="utf-8"
-                            ) as f:
-                                f.write(content)
+                            shutil.copyfile(
+                                dialog.temp_downloaded_file, playlist.cached_file_path
+                            )
                             self.playlist_manager.save_playlists()
 
                         # Clean up temporary file
@@ -762,19 +756,10 @@ class PlaylistManagerWindow(QMainWindow):
             progress_dialog.setLabelText("Updating cache...")
             progress_dialog.setValue(95)
 
-            # Read the downloaded content
-            with open(temp_file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
             # Update the cache with the new content
             if playlist.cached_file_path:
-                # Remove old cache file if it exists
-                if os.path.exists(playlist.cached_file_path):
-                    os.remove(playlist.cached_file_path)
-
-                # Save the new content to cache
-                with open(playlist.cached_file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+                # Stream the new content over the old cache file
+                shutil.copyfile(temp_file_path, playlist.cached_file_path)
 
                 # Update playlist metadata
                 playlist.update_last_opened()
@@ -831,6 +816,9 @@ class PlaylistManagerWindow(QMainWindow):
 
         playlist = current_item.data(Qt.ItemDataRole.UserRole)
 
+        # Launching must see the source as it is now, not a cached probe from
+        # the last list repaint (which could hide an outage or a recovery)
+        playlist.invalidate_availability()
         if not playlist.is_available():
             QMessageBox.warning(
                 self,
@@ -1,3 +1,4 @@
+import functools
 import os
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import QStyleFactory
@@ -19,8 +20,9 @@ class KDEIntegratedTheme:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def is_kde_environment():
-        """Check if we're running in KDE."""
+        """Check if we're running in KDE (evaluated once per process)."""
         desktop_env = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
         session = os.environ.get("DESKTOP_SESSION", "").lower()
         kde_session = os.environ.get("KDE_SESSION_VERSION", "")
@@ -1,8 +1,23 @@
 import os
 import tempfile
+import uuid
+from urllib.parse import urlparse
 from PySide6.QtCore import QThread, Signal
 
 
+def make_temp_playlist_path(url):
+    """
+    Build a unique path in the temp directory for a playlist downloaded from url.
+
+    The URL's file name is kept (with .m3u8 appended if it has no playlist
+    extension) behind a short random prefix to avoid conflicts.
+    """
+    filename = os.path.basename(urlparse(url).path) or "playlist"
+    if not filename.endswith((".m3u", ".m3u8")):
+        filename += ".m3u8"
+    return os.path.join(tempfile.gettempdir(), f"{uuid.uuid4().hex[:8]}_{filename}")
+
+
 class URLDownloadWorker(QThread):
     """Worker thread for downloading URL-based playlists."""
 
@@ -34,11 +49,16 @@ class URLDownloadWorker(QThread):
             # Download the playlist content with progress callback
             self.status_updated.emit("Downloading playlist...")
 
+            last_progress = [None]
+
             def progress_callback(progress):
                 if not self._should_cancel:
                     # Map progress to 10-90% range (leaving room for file operations)
                     mapped_progress = 10 + int(progress * 0.8)
-                    self.progress_updated.emit(mapped_progress)
+                    # Only cross the thread boundary when the value changes
+                    if mapped_progress != last_progress[0]:
+                        last_progress[0] = mapped_progress
+                        self.progress_updated.emit(mapped_progress)
 
             content = self.playlist_manager.download_url_playlist(
                 self.url, timeout=600, progress_callback=progress_callback
@@ -51,21 +71,7 @@ class URLDownloadWorker(QThread):
             self.status_updated.emit("Saving playlist...")
 
             # Create a temporary file to store the downloaded content
-            temp_dir = tempfile.gettempdir()
-            from urllib.parse import urlparse
-
-            parsed_url = urlparse(self.url)
-
-            # Generate a filename from the URL
-            filename = os.path.basename(parsed_url.path) or "playlist"
-            if not filename.endswith((".m3u", ".m3u8")):
-                filename += ".m3u8"
-
-            # Create a unique filename to avoid conflicts
-            import uuid
-
-            unique_filename = f"{uuid.uuid4().hex[:8]}_{filename}"
-            temp_file_path = os.path.join(temp_dir, unique_filename)
+            temp_file_path = make_temp_playlist_path(self.url)
 
             # Write the content to the temporary file
             try: